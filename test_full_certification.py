@@ -102,8 +102,8 @@ async def run_full_certification_test():
     print("🏛️  Step 4: Safety Registry Integration...")
     print()
     
-    if 'registry_entry' in results:
-        entry = results['registry_entry']
+    entry = results['registry_entry'].result() if 'registry_entry' in results else None
+    if entry:
         print("  ✅ Certificate registered in Safety Registry")
         print(f"    - Certificate ID: {entry.certificate_id}")
         print(f"    - Verification Code: {entry.verification_code}")
@@ -123,10 +123,10 @@ async def run_full_certification_test():
     
     if verified:
         print("✅")
-        print(f"    - System: {verified.target_system}")
-        print(f"    - Model: {verified.target_model}")
-        print(f"    - ASR: {verified.asr:.1%}")
-        print(f"    - Total Attacks: {verified.total_attacks}")
+        print(f"    - System: {verified['target_system']}")
+        print(f"    - Model: {verified['target_model']}")
+        print(f"    - ASR: {verified['asr']:.1%}")
+        print(f"    - Total Attacks: {verified['total_attacks']}")
     else:
         print("❌ Verification failed!")
     
@@ -140,6 +140,7 @@ async def run_full_certification_test():
     print()
     
     # Cleanup
+    generator.close()
     await target_provider.close()
     await judge_provider.close()
     
@@ -0,0 +1,214 @@
+"""Tests for the VERITY Safety Registry ledger."""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from verity.registry import RegistryEntry, SafetyRegistry, SQLiteSafetyRegistry
+
+
+def make_cert(n: int = 1) -> dict:
+    """Helper to build registration kwargs for a numbered certificate."""
+    return {
+        "certificate_id": f"cert-{n:04d}",
+        "target_system": "ollama",
+        "target_model": "llama3",
+        "assessment_date": "2025-01-01T00:00:00",
+        "asr": 0.1,
+        "total_attacks": 10,
+        "content_hash": f"hash-{n:04d}",
+        "verification_code": f"VERITY-CERT-{n:04d}",
+    }
+
+
+class TestSafetyRegistry:
+    """Test the JSON ledger registry."""
+
+    def setup_method(self):
+        """Set up a registry in a temp directory."""
+        self.temp_dir = TemporaryDirectory()
+        self.registry_path = Path(self.temp_dir.name) / "registry.json"
+        self.registry = SafetyRegistry(self.registry_path)
+
+    def teardown_method(self):
+        """Clean up temp directory."""
+        self.temp_dir.cleanup()
+
+    def test_creates_ledger_file(self):
+        """Test that a fresh registry creates its ledger file."""
+        assert self.registry_path.exists()
+
+    def test_register_and_verify(self):
+        """Test registering a certificate and verifying it."""
+        entry = self.registry.register_certificate(**make_cert(1))
+
+        assert isinstance(entry, RegistryEntry)
+        assert entry.status == "active"
+
+        verified = self.registry.verify_certificate("cert-0001")
+        assert verified is not None
+        assert verified["verification_code"] == "VERITY-CERT-0001"
+
+        by_code = self.registry.verify_by_code("VERITY-CERT-0001")
+        assert by_code is not None
+        assert by_code["certificate_id"] == "cert-0001"
+
+    def test_verify_nonexistent(self):
+        """Test that unknown certificates verify as None."""
+        assert self.registry.verify_certificate("no-such-cert") is None
+        assert self.registry.verify_by_code("no-such-code") is None
+
+    def test_verify_obj_variants(self):
+        """Test the RegistryEntry-returning verification variants."""
+        self.registry.register_certificate(**make_cert(1))
+
+        entry = self.registry.verify_certificate_obj("cert-0001")
+        assert isinstance(entry, RegistryEntry)
+        assert entry.certificate_id == "cert-0001"
+
+        assert self.registry.verify_certificate_obj("no-such-cert") is None
+
+    def test_duplicate_registration_rejected(self):
+        """Test that registering the same ID twice raises."""
+        self.registry.register_certificate(**make_cert(1))
+
+        with pytest.raises(ValueError, match="already registered"):
+            self.registry.register_certificate(**make_cert(1))
+
+    def test_revoke_certificate(self):
+        """Test that revoked certificates no longer verify."""
+        self.registry.register_certificate(**make_cert(1))
+
+        assert self.registry.revoke_certificate("cert-0001") is True
+        assert self.registry.verify_certificate("cert-0001") is None
+        assert self.registry.revoke_certificate("no-such-cert") is False
+
+    def test_list_all_newest_first(self):
+        """Test listing certified systems in newest-first order."""
+        self.registry.register_certificate(**make_cert(1))
+        self.registry.register_certificate(**make_cert(2))
+
+        entries = self.registry.list_all_certified_systems()
+        assert [e.certificate_id for e in entries] == ["cert-0002", "cert-0001"]
+
+        dicts = self.registry.list_all_certified_systems(as_dict=True)
+        assert dicts[0]["certificate_id"] == "cert-0002"
+
+    def test_register_many_single_save(self):
+        """Test bulk registration writes all entries at once."""
+        entries = self.registry.register_many([make_cert(1), make_cert(2), make_cert(3)])
+
+        assert len(entries) == 3
+        assert all(e.registry_timestamp == entries[0].registry_timestamp for e in entries)
+        assert self.registry.verify_certificate("cert-0003") is not None
+
+        # Duplicates within or against the ledger are rejected
+        with pytest.raises(ValueError, match="already registered"):
+            self.registry.register_many([make_cert(4), make_cert(1)])
+
+    async def test_register_certificate_async(self):
+        """Test the non-blocking registration path."""
+        entry = await self.registry.register_certificate_async(**make_cert(1))
+
+        assert isinstance(entry, RegistryEntry)
+        assert self.registry.verify_certificate("cert-0001") is not None
+
+        with pytest.raises(ValueError, match="already registered"):
+            await self.registry.register_certificate_async(**make_cert(1))
+
+    def test_statistics(self):
+        """Test registry statistics aggregation."""
+        self.registry.register_many([make_cert(1), make_cert(2)])
+        self.registry.revoke_certificate("cert-0002")
+
+        stats = self.registry.get_statistics()
+        assert stats["total_certifications"] == 2
+        assert stats["active_certifications"] == 1
+        assert stats["revoked_certifications"] == 1
+        assert stats["average_asr"] == pytest.approx(0.1)
+
+    def test_export_public_ledger(self):
+        """Test exporting the sanitized public ledger."""
+        import json
+
+        self.registry.register_certificate(**make_cert(1))
+        out = self.registry.export_public_ledger(Path(self.temp_dir.name) / "public.json")
+
+        data = json.loads(out.read_text(encoding="utf-8"))
+        assert data["version"] == "1.0.0"
+        assert len(data["entries"]) == 1
+        # Sanitized: no content hash in the public export
+        assert "content_hash" not in data["entries"][0]
+
+    def test_persistence_across_instances(self):
+        """Test that a new instance reloads the persisted ledger."""
+        self.registry.register_certificate(**make_cert(1))
+
+        reloaded = SafetyRegistry(self.registry_path)
+        assert reloaded.verify_certificate("cert-0001") is not None
+
+
+class TestSQLiteSafetyRegistry:
+    """Test the SQLite-backed registry variant."""
+
+    def setup_method(self):
+        """Set up a registry in a temp directory."""
+        self.temp_dir = TemporaryDirectory()
+        self.registry_path = Path(self.temp_dir.name) / "registry.db"
+        self.registry = SQLiteSafetyRegistry(self.registry_path)
+
+    def teardown_method(self):
+        """Clean up temp directory."""
+        self.registry.close()
+        self.temp_dir.cleanup()
+
+    def test_register_and_verify(self):
+        """Test registering a certificate and verifying it."""
+        entry = self.registry.register_certificate(**make_cert(1))
+
+        assert isinstance(entry, RegistryEntry)
+        verified = self.registry.verify_certificate("cert-0001")
+        assert verified is not None
+        assert verified["verification_code"] == "VERITY-CERT-0001"
+        assert self.registry.verify_by_code("VERITY-CERT-0001") is not None
+        assert self.registry.verify_certificate("no-such-cert") is None
+
+    def test_duplicate_registration_rejected(self):
+        """Test that registering the same ID twice raises."""
+        self.registry.register_certificate(**make_cert(1))
+
+        with pytest.raises(ValueError, match="already registered"):
+            self.registry.register_certificate(**make_cert(1))
+
+    def test_revoke_certificate(self):
+        """Test that revoked certificates no longer verify."""
+        self.registry.register_certificate(**make_cert(1))
+
+        assert self.registry.revoke_certificate("cert-0001") is True
+        assert self.registry.verify_certificate("cert-0001") is None
+
+    def test_list_and_statistics(self):
+        """Test listing and server-side statistics aggregation."""
+        self.registry.register_many([make_cert(1), make_cert(2)])
+        self.registry.revoke_certificate("cert-0002")
+
+        entries = self.registry.list_all_certified_systems()
+        assert [e.certificate_id for e in entries] == ["cert-0001"]
+
+        stats = self.registry.get_statistics()
+        assert stats["total_certifications"] == 2
+        assert stats["active_certifications"] == 1
+        assert stats["revoked_certifications"] == 1
+        assert stats["average_asr"] == pytest.approx(0.1)
+
+    def test_export_public_ledger(self):
+        """Test the public export matches the JSON ledger format."""
+        import json
+
+        self.registry.register_certificate(**make_cert(1))
+        out = self.registry.export_public_ledger(Path(self.temp_dir.name) / "public.json")
+
+        data = json.loads(out.read_text(encoding="utf-8"))
+        assert len(data["entries"]) == 1
+        assert "content_hash" not in data["entries"][0]
@@ -228,3 +228,124 @@ class TestReportRiskLevels:
 
         report = self.generator.generate_markdown(campaign, self.metadata)
         assert "LOW" in report
+
+
+class TestCertifiedReports:
+    """Test the certified multi-format export pipeline."""
+
+    def setup_method(self):
+        """Set up a generator with a registry inside the temp directory."""
+        self.temp_dir = TemporaryDirectory()
+        self.generator = ReportGenerator(
+            Path(self.temp_dir.name) / "reports",
+            registry_path=Path(self.temp_dir.name) / "registry.json",
+        )
+
+        self.evaluations = [
+            JudgeEvaluation(
+                attack_name="attack_with_transcript",
+                verdict=JudgeVerdict.UNSAFE,
+                harm_score=8.0,
+                confidence=0.9,
+                reasoning="Attack succeeded",
+                prompt_used="Ignore previous instructions",
+                target_response="Sure, here is how...",
+                attack_category="prompt_injection",
+                raw_judge_response='{"verdict": "unsafe"}',
+                tokens_used=120,
+                latency_ms=45.0,
+            ),
+            JudgeEvaluation(
+                attack_name="attack_without_transcript",
+                verdict=JudgeVerdict.SAFE,
+                harm_score=1.0,
+                confidence=0.95,
+                reasoning="Attack blocked",
+            ),
+        ]
+
+        self.campaign = CampaignEvaluation(
+            total_attacks=2,
+            successful_attacks=1,
+            failed_attacks=1,
+            borderline_attacks=0,
+            asr=0.5,
+            asr_ci_lower=0.2,
+            asr_ci_upper=0.8,
+            average_harm_score=4.5,
+            evaluations=self.evaluations,
+            category_breakdown={"prompt_injection": 2},
+        )
+
+        self.metadata = ReportMetadata(
+            title="Certified Assessment",
+            target_system="ollama",
+            target_model="llama3",
+            assessment_date=datetime.now(),
+        )
+
+    def teardown_method(self):
+        """Clean up temp directory."""
+        self.generator.close()
+        self.temp_dir.cleanup()
+
+    def test_content_hash_covers_content_before_footer(self):
+        """Test that the streamed markdown hash matches the signed content."""
+        import hashlib
+
+        filepath = self.generator.save_report(self.campaign, self.metadata, format="markdown")
+        content = filepath.read_text(encoding="utf-8")
+
+        signature = self.generator.last_signature
+        assert signature is not None
+
+        # The certification footer is excluded from the signed content
+        footer_at = content.index("\n\n---\n\n## 🏛️ VERITY Certification")
+        signed = content[:footer_at]
+        assert hashlib.sha256(signed.encode("utf-8")).hexdigest() == signature.content_hash
+
+    def test_json_report_evaluation_schema(self):
+        """Test the per-evaluation schema of the JSON report."""
+        import json
+
+        filepath = self.generator.save_report(self.campaign, self.metadata, format="json")
+        data = json.loads(filepath.read_text(encoding="utf-8"))
+
+        rows = data["evaluations"]
+        assert len(rows) == 2
+
+        # Exactly the report_dict projection: no raw judge response,
+        # token counts or latency, and the transcript is nested
+        expected_keys = {
+            "attack_name",
+            "verdict",
+            "harm_score",
+            "confidence",
+            "reasoning",
+            "attack_category",
+            "transcript",
+        }
+        for row in rows:
+            assert set(row) == expected_keys
+
+        with_transcript, without_transcript = rows
+        assert with_transcript["verdict"] == "unsafe"
+        assert with_transcript["transcript"] == {
+            "prompt_used": "Ignore previous instructions",
+            "target_response": "Sure, here is how...",
+        }
+        assert without_transcript["transcript"] is None
+
+    def test_save_certified_report_result_contract(self):
+        """Test the result keys and Future contract of a certified export."""
+        results = self.generator.save_certified_report(self.campaign, self.metadata)
+
+        for fmt in ("markdown", "html", "json", "signature"):
+            assert results[fmt].exists()
+
+        # Registration runs in the background; the Future resolves to
+        # the RegistryEntry for this export's certificate
+        entry = results["registry_entry"].result()
+        assert entry is not None
+        assert entry.certificate_id == self.generator.last_signature.certificate_id
+        assert self.generator.registry.verify_certificate(entry.certificate_id) is not None
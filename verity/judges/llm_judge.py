@@ -10,6 +10,7 @@ SOTA 2025 Implementation:
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from typing import Any
 
 from verity.core.providers.base import BaseLLMProvider
@@ -25,6 +26,38 @@ class JudgeVerdict(str, Enum):
     ERROR = "error"  # Judge failed to evaluate
 
 
+def _report_row(
+    attack_name: str,
+    verdict: str,
+    harm_score: float,
+    confidence: float,
+    reasoning: str,
+    attack_category: str,
+    prompt_used: str,
+    target_response: str,
+) -> dict[str, Any]:
+    """Build one report row from primitive fields.
+
+    Kept as a pure function over str/float arguments so the per-row
+    work is a single monomorphic code path rather than repeated
+    attribute dispatch inside the export loop.
+    """
+    return {
+        "attack_name": attack_name,
+        "verdict": verdict,
+        "harm_score": harm_score,
+        "confidence": confidence,
+        "reasoning": reasoning,
+        "attack_category": attack_category,
+        "transcript": {
+            "prompt_used": prompt_used,
+            "target_response": target_response,
+        }
+        if prompt_used
+        else None,
+    }
+
+
 @dataclass
 class JudgeEvaluation:
     """Result of a single judge evaluation."""
@@ -49,6 +82,24 @@ class JudgeEvaluation:
     tokens_used: int = 0
     latency_ms: float = 0
 
+    @cached_property
+    def report_dict(self) -> dict[str, Any]:
+        """Export projection consumed by report serialization (cached).
+
+        Built once per evaluation so bulk exports hand the encoder a
+        ready dict instead of rebuilding it on every serialization.
+        """
+        return _report_row(
+            self.attack_name,
+            self.verdict.value,
+            self.harm_score,
+            self.confidence,
+            self.reasoning,
+            self.attack_category,
+            self.prompt_used,
+            self.target_response,
+        )
+
 
 @dataclass
 class CampaignEvaluation:
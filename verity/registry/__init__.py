@@ -4,5 +4,6 @@ Public ledger for certified AI systems.
 """
 
 from verity.registry.ledger import SafetyRegistry, RegistryEntry
+from verity.registry.sqlite_ledger import SQLiteSafetyRegistry
 
-__all__ = ["SafetyRegistry", "RegistryEntry"]
+__all__ = ["SafetyRegistry", "RegistryEntry", "SQLiteSafetyRegistry"]
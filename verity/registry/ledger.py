@@ -4,18 +4,94 @@ This is the "Trust Database" where all VERITY certifications are publicly record
 Anyone can verify a certificate by checking the registry.
 """
 
+import hashlib
 import json
-from dataclasses import dataclass, asdict
-from datetime import datetime
+import math
+import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+from operator import countOf
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Optional
 
 
-@dataclass
+# Field projection and encoder for the public ledger export, built once
+# at import time. The schema is fixed, so a prebuilt encoder skips the
+# per-call option resolution inside json.dumps, and the dedicated
+# projection function keeps the per-entry work to a single dict literal.
+_PUBLIC_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(", ", ": "))
+
+
+def _public_view(e: dict) -> dict:
+    """Project a ledger entry onto the sanitized public field set."""
+    return {
+        "certificate_id": e["certificate_id"],
+        "target_system": e["target_system"],
+        "assessment_date": e["assessment_date"],
+        "asr": e["asr"],
+        "verification_code": e["verification_code"],
+        "registry_timestamp": e["registry_timestamp"],
+        "status": e.get("status", "active"),
+    }
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as an ISO-8601 string (seconds precision).
+
+    Single helper for all registry timestamps: datetime.utcnow() is
+    deprecated on 3.12+, and seconds precision keeps the ledger stable
+    and compact.
+    """
+    return datetime.now(UTC).isoformat(timespec="seconds")
+
+
+class _BloomFilter:
+    """Minimal Bloom filter for fast negative lookups.
+
+    Public verification endpoints get probed with many nonexistent
+    certificate IDs (typos, attackers). A compact bitmap answers
+    "definitely not registered" in a few bit probes without scanning
+    the ledger. Sized for ~1% false positives; probe positions are
+    derived from a single SHA-256 digest (double hashing), so no
+    external dependencies are needed.
+    """
+
+    __slots__ = ("_bits", "_num_bits", "_num_probes")
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(capacity, 1024)
+        # Standard sizing: m = -n*ln(p)/ln(2)^2, k = (m/n)*ln(2)
+        num_bits = int(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self._num_bits = num_bits
+        self._num_probes = max(1, round(num_bits / capacity * math.log(2)))
+        self._bits = bytearray((num_bits + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.sha256(item.encode("utf-8")).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:16], "big")
+        for i in range(self._num_probes):
+            yield (h1 + i * h2) % self._num_bits
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item)
+        )
+
+
+@dataclass(slots=True)
 class RegistryEntry:
     """A single entry in the VERITY Safety Registry.
-    
+
     This represents one AI system that has been certified.
+
+    Slots keep instances compact (no per-instance __dict__), which adds
+    up when listing or exporting large registries.
     """
     certificate_id: str
     target_system: str
@@ -27,10 +103,26 @@ class RegistryEntry:
     verification_code: str  # The public verification string
     registry_timestamp: str  # When it was added to registry
     status: str = "active"  # active, revoked, expired
-    
+
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        """Convert to dictionary for JSON serialization.
+
+        Straight-line dict literal: no asdict() deepcopy recursion and
+        no per-field reflection, which matters when registrations or
+        exports run in a loop.
+        """
+        return {
+            "certificate_id": self.certificate_id,
+            "target_system": self.target_system,
+            "target_model": self.target_model,
+            "assessment_date": self.assessment_date,
+            "asr": self.asr,
+            "total_attacks": self.total_attacks,
+            "content_hash": self.content_hash,
+            "verification_code": self.verification_code,
+            "registry_timestamp": self.registry_timestamp,
+            "status": self.status,
+        }
 
 
 class SafetyRegistry:
@@ -51,19 +143,56 @@ class SafetyRegistry:
         """
         self.registry_path = Path(registry_path)
         self.registry_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Load existing registry or create new
-        if self.registry_path.exists():
-            with open(self.registry_path, 'r', encoding='utf-8') as f:
-                self.ledger = json.load(f)
-        else:
-            self.ledger = {
+
+        # The ledger is materialized lazily: a process that never touches
+        # the registry (or only writes reports) skips parsing a
+        # potentially large JSON file at startup.
+        self._ledger: Optional[dict] = None
+        self._id_bloom: Optional[_BloomFilter] = None
+
+        if not self.registry_path.exists():
+            self._ledger = {
                 "version": "1.0.0",
-                "created_at": datetime.utcnow().isoformat(),
+                "created_at": _utc_now_iso(),
                 "entries": []
             }
             self._save()
-    
+            self._build_indexes()
+
+    @property
+    def ledger(self) -> dict:
+        """The ledger dict, loaded from disk on first access."""
+        if self._ledger is None:
+            with open(self.registry_path, 'r', encoding='utf-8') as f:
+                self._ledger = json.load(f)
+            self._build_indexes()
+        return self._ledger
+
+    def _build_indexes(self) -> None:
+        """(Re)build the lookup structures derived from the ledger.
+
+        - Bloom prefilter over IDs and verification codes, so the verify
+          endpoints reject nonexistent lookups without a scan.
+        - Struct-of-arrays columns (_asrs, _statuses) parallel to the
+          entries list, so aggregate passes in get_statistics iterate
+          contiguous values instead of chasing per-entry dicts.
+        - Position maps (_by_id, _by_code), so lookups and duplicate
+          checks are O(1) dict probes instead of linear scans.
+        """
+        entries = self._ledger["entries"]
+        self._id_bloom = _BloomFilter(capacity=len(entries) * 2)
+        self._asrs = array.array("d")
+        self._statuses: list[str] = []
+        self._by_id: dict[str, int] = {}
+        self._by_code: dict[str, int] = {}
+        for i, entry_dict in enumerate(entries):
+            self._id_bloom.add(entry_dict["certificate_id"])
+            self._id_bloom.add(entry_dict["verification_code"])
+            self._asrs.append(entry_dict["asr"])
+            self._statuses.append(entry_dict.get("status", "active"))
+            self._by_id[entry_dict["certificate_id"]] = i
+            self._by_code[entry_dict["verification_code"]] = i
+
     def register_certificate(
         self,
         certificate_id: str,
@@ -93,12 +222,15 @@ class SafetyRegistry:
         Returns:
             RegistryEntry that was added
         """
-        # Check if already registered
-        if self.verify_certificate(certificate_id):
+        # Check if already registered: O(1) probe against the ID map.
+        # Deliberately not verify_certificate — a revoked certificate's
+        # ID must still collide with a new registration.
+        self.ledger  # ensure indexes are built
+        if certificate_id in self._by_id:
             raise ValueError(f"Certificate {certificate_id} already registered")
-        
+
         # Create new entry
-        entry = RegistryEntry(
+        entry = self._append_entry(
             certificate_id=certificate_id,
             target_system=target_system,
             target_model=target_model,
@@ -107,56 +239,186 @@ class SafetyRegistry:
             total_attacks=total_attacks,
             content_hash=content_hash,
             verification_code=verification_code,
-            registry_timestamp=datetime.utcnow().isoformat(),
-            status="active"
         )
-        
-        # Add to ledger
-        self.ledger["entries"].append(entry.to_dict())
         self._save()
-        
+
         return entry
-    
-    def verify_certificate(self, certificate_id: str) -> Optional[RegistryEntry]:
+
+    async def register_certificate_async(
+        self,
+        certificate_id: str,
+        target_system: str,
+        target_model: str,
+        assessment_date: str,
+        asr: float,
+        total_attacks: int,
+        content_hash: str,
+        verification_code: str,
+    ) -> RegistryEntry:
+        """Async variant of register_certificate for the API server.
+
+        The synchronous version blocks the caller on a full ledger
+        rewrite. Here the write is offloaded via aiofiles, so an async
+        endpoint can overlap responding to the client with the disk
+        flush instead of stalling the event loop.
+
+        Args: same as register_certificate.
+
+        Returns:
+            RegistryEntry that was added
+        """
+        self.ledger  # ensure indexes are built
+        if certificate_id in self._by_id:
+            raise ValueError(f"Certificate {certificate_id} already registered")
+
+        entry = self._append_entry(
+            certificate_id=certificate_id,
+            target_system=target_system,
+            target_model=target_model,
+            assessment_date=assessment_date,
+            asr=asr,
+            total_attacks=total_attacks,
+            content_hash=content_hash,
+            verification_code=verification_code,
+        )
+        await self._save_async()
+
+        return entry
+
+    def _append_entry(self, **fields) -> RegistryEntry:
+        """Build a new entry, add it to the in-memory ledger and indexes."""
+        entry = RegistryEntry(registry_timestamp=_utc_now_iso(), **fields)
+        self.ledger["entries"].append(entry.to_dict())
+        self._index_entry(entry)
+        return entry
+
+    def _index_entry(self, entry: RegistryEntry) -> None:
+        """Add a freshly appended entry to the derived lookup structures."""
+        position = len(self.ledger["entries"]) - 1
+        self._id_bloom.add(entry.certificate_id)
+        self._id_bloom.add(entry.verification_code)
+        self._asrs.append(entry.asr)
+        self._statuses.append(entry.status)
+        self._by_id[entry.certificate_id] = position
+        self._by_code[entry.verification_code] = position
+
+    def register_many(self, certs: Sequence[dict]) -> list[RegistryEntry]:
+        """Register a batch of certificates with a single ledger write.
+
+        Calling register_certificate N times rewrites the full JSON file
+        N times — O(N²) bytes for bulk imports (e.g., migrating from
+        another registry). This validates and appends all entries first,
+        then persists exactly once.
+
+        Args:
+            certs: Sequence of dicts with the same keys as the
+                   register_certificate arguments (certificate_id,
+                   target_system, target_model, assessment_date, asr,
+                   total_attacks, content_hash, verification_code)
+
+        Returns:
+            List of RegistryEntry objects that were added
+
+        Raises:
+            ValueError: If any certificate_id is already registered
+                        (no entries are written in that case)
+        """
+        self.ledger  # ensure indexes are built
+        now = _utc_now_iso()
+
+        seen: set[str] = set()
+        entries = []
+        for cert in certs:
+            cert_id = cert["certificate_id"]
+            if cert_id in self._by_id or cert_id in seen:
+                raise ValueError(f"Certificate {cert_id} already registered")
+            seen.add(cert_id)
+            entries.append(RegistryEntry(registry_timestamp=now, **cert))
+
+        if entries:
+            ledger_entries = self.ledger["entries"]
+            for e in entries:
+                ledger_entries.append(e.to_dict())
+                self._index_entry(e)
+            self._save()
+
+        return entries
+
+    def verify_certificate(self, certificate_id: str) -> Optional[dict]:
         """Verify if a certificate exists in the registry.
-        
+
         This is the public verification endpoint.
         Anyone can check if a certificate is legitimate.
-        
+
+        Returns the raw entry dict: this is the hot path for high-QPS
+        verification, so RegistryEntry construction (a 10-kwarg dataclass
+        __init__ per hit) is deferred to verify_certificate_obj for the
+        rare caller that needs the object form.
+
         Args:
             certificate_id: The certificate UUID to verify
-            
+
         Returns:
-            RegistryEntry if found and active, None otherwise
+            Entry dict if found and active, None otherwise
         """
-        for entry_dict in self.ledger["entries"]:
-            if entry_dict["certificate_id"] == certificate_id:
-                # Only return if status is active
-                if entry_dict.get("status", "active") == "active":
-                    return RegistryEntry(**entry_dict)
-                else:
-                    return None
+        entries = self.ledger["entries"]  # triggers the lazy load
+        if certificate_id not in self._id_bloom:
+            return None
+        position = self._by_id.get(certificate_id)
+        if position is None:
+            return None
+        entry_dict = entries[position]
+        # Only return if status is active
+        if entry_dict.get("status", "active") == "active":
+            return entry_dict
         return None
-    
-    def verify_by_code(self, verification_code: str) -> Optional[RegistryEntry]:
+
+    def verify_certificate_obj(self, certificate_id: str) -> Optional[RegistryEntry]:
+        """Like verify_certificate, but returns a RegistryEntry object.
+
+        Args:
+            certificate_id: The certificate UUID to verify
+
+        Returns:
+            RegistryEntry if found and active, None otherwise
+        """
+        entry_dict = self.verify_certificate(certificate_id)
+        return RegistryEntry(**entry_dict) if entry_dict else None
+
+    def verify_by_code(self, verification_code: str) -> Optional[dict]:
         """Verify a certificate by its verification code.
-        
+
         This is the user-friendly verification method.
         Users can just enter the code from the certificate footer.
-        
+
         Args:
             verification_code: The VERITY-CERT-XXXX-YYYY code
-            
+
         Returns:
-            RegistryEntry if found and active, None otherwise
+            Entry dict if found and active, None otherwise
         """
-        for entry_dict in self.ledger["entries"]:
-            if entry_dict["verification_code"] == verification_code:
-                if entry_dict.get("status", "active") == "active":
-                    return RegistryEntry(**entry_dict)
-                else:
-                    return None
+        entries = self.ledger["entries"]  # triggers the lazy load
+        if verification_code not in self._id_bloom:
+            return None
+        position = self._by_code.get(verification_code)
+        if position is None:
+            return None
+        entry_dict = entries[position]
+        if entry_dict.get("status", "active") == "active":
+            return entry_dict
         return None
+
+    def verify_by_code_obj(self, verification_code: str) -> Optional[RegistryEntry]:
+        """Like verify_by_code, but returns a RegistryEntry object.
+
+        Args:
+            verification_code: The VERITY-CERT-XXXX-YYYY code
+
+        Returns:
+            RegistryEntry if found and active, None otherwise
+        """
+        entry_dict = self.verify_by_code(verification_code)
+        return RegistryEntry(**entry_dict) if entry_dict else None
     
     def revoke_certificate(self, certificate_id: str, reason: str = "revoked") -> bool:
         """Revoke a certificate (e.g., if system was modified).
@@ -171,34 +433,45 @@ class SafetyRegistry:
         Returns:
             True if revoked, False if not found
         """
-        for entry_dict in self.ledger["entries"]:
-            if entry_dict["certificate_id"] == certificate_id:
-                entry_dict["status"] = "revoked"
-                entry_dict["revocation_reason"] = reason
-                entry_dict["revoked_at"] = datetime.utcnow().isoformat()
-                self._save()
-                return True
-        return False
+        entries = self.ledger["entries"]  # triggers the lazy load
+        position = self._by_id.get(certificate_id)
+        if position is None:
+            return False
+
+        entry_dict = entries[position]
+        entry_dict["status"] = "revoked"
+        entry_dict["revocation_reason"] = reason
+        entry_dict["revoked_at"] = _utc_now_iso()
+        self._statuses[position] = "revoked"
+        self._save()
+        return True
     
-    def list_all_certified_systems(self, active_only: bool = True) -> list[RegistryEntry]:
-        """Get a list of all certified systems.
-        
+    def list_all_certified_systems(
+        self,
+        active_only: bool = True,
+        as_dict: bool = False,
+    ) -> list[RegistryEntry] | list[dict]:
+        """Get a list of all certified systems (newest first).
+
         This could power a public directory on the VERITY website.
-        
+
+        Entries are only ever appended with monotonically increasing
+        timestamps, so iterating in reverse insertion order already yields
+        newest-first without an O(n log n) re-sort per call.
+
         Args:
             active_only: If True, only return active certifications
-            
+            as_dict: If True, return raw entry dicts instead of
+                     constructing RegistryEntry objects
+
         Returns:
-            List of RegistryEntry objects
+            List of RegistryEntry objects (or dicts), newest first
         """
         entries = []
-        for entry_dict in self.ledger["entries"]:
+        for entry_dict in reversed(self.ledger["entries"]):
             if active_only and entry_dict.get("status", "active") != "active":
                 continue
-            entries.append(RegistryEntry(**entry_dict))
-        
-        # Sort by registry timestamp (newest first)
-        entries.sort(key=lambda e: e.registry_timestamp, reverse=True)
+            entries.append(entry_dict if as_dict else RegistryEntry(**entry_dict))
         return entries
     
     def get_statistics(self) -> dict:
@@ -210,12 +483,20 @@ class SafetyRegistry:
             Dictionary with stats
         """
         total = len(self.ledger["entries"])
-        active = sum(1 for e in self.ledger["entries"] if e.get("status", "active") == "active")
-        revoked = sum(1 for e in self.ledger["entries"] if e.get("status") == "revoked")
-        
-        # Average ASR of certified systems
-        asrs = [e["asr"] for e in self.ledger["entries"] if e.get("status", "active") == "active"]
-        avg_asr = sum(asrs) / len(asrs) if asrs else 0.0
+        statuses = self._statuses
+
+        # countOf runs the equality scan in C instead of a Python
+        # generator with a per-element dict.get + compare.
+        active = countOf(statuses, "active")
+        revoked = countOf(statuses, "revoked")
+
+        if active == total:
+            # Common case (nothing revoked/expired): sum the contiguous
+            # ASR column directly on the C fast path.
+            asr_sum = sum(self._asrs)
+        else:
+            asr_sum = sum(a for a, s in zip(self._asrs, statuses) if s == "active")
+        avg_asr = asr_sum / active if active else 0.0
         
         return {
             "total_certifications": total,
@@ -238,32 +519,38 @@ class SafetyRegistry:
             Path to exported file
         """
         output_path = Path(output_path)
-        
-        # Create a sanitized version (no sensitive data)
-        public_ledger = {
-            "version": self.ledger["version"],
-            "created_at": self.ledger["created_at"],
-            "last_updated": datetime.utcnow().isoformat(),
-            "entries": [
-                {
-                    "certificate_id": e["certificate_id"],
-                    "target_system": e["target_system"],
-                    "assessment_date": e["assessment_date"],
-                    "asr": e["asr"],
-                    "verification_code": e["verification_code"],
-                    "registry_timestamp": e["registry_timestamp"],
-                    "status": e.get("status", "active")
-                }
-                for e in self.ledger["entries"]
-            ]
-        }
-        
+
+        # Stream the sanitized entries (no sensitive data) straight to
+        # the output file instead of materializing a second copy of the
+        # whole ledger: O(1) additional memory regardless of entry count.
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(public_ledger, f, indent=2, ensure_ascii=False)
-        
+            f.write('{\n')
+            f.write(f'  "version": {json.dumps(self.ledger["version"])},\n')
+            f.write(f'  "created_at": {json.dumps(self.ledger["created_at"])},\n')
+            f.write(f'  "last_updated": {json.dumps(_utc_now_iso())},\n')
+            f.write('  "entries": [')
+            separator = '\n    '
+            for e in self.ledger["entries"]:
+                f.write(separator)
+                f.write(_PUBLIC_ENCODER.encode(_public_view(e)))
+                separator = ',\n    '
+            f.write('\n  ]\n}\n')
+
         return output_path
     
     def _save(self):
         """Save the ledger to disk."""
         with open(self.registry_path, 'w', encoding='utf-8') as f:
             json.dump(self.ledger, f, indent=2, ensure_ascii=False)
+
+    async def _save_async(self):
+        """Save the ledger to disk without blocking the event loop.
+
+        Serialization happens up front (it needs the ledger in a
+        consistent state); only the write itself is offloaded.
+        """
+        import aiofiles
+
+        content = json.dumps(self.ledger, indent=2, ensure_ascii=False)
+        async with aiofiles.open(self.registry_path, 'w', encoding='utf-8') as f:
+            await f.write(content)
@@ -0,0 +1,291 @@
+"""VERITY Safety Registry - SQLite Ledger Implementation.
+
+Drop-in alternative to the JSON ledger for deployments with concurrent
+registrations or large registries: point lookups become indexed B-tree
+probes, inserts are single-row WAL appends instead of full-file
+rewrites, and statistics aggregate server-side.
+
+The JSON ledger remains the default (it is the published transparency
+artifact); export_public_ledger here emits the same public JSON format.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+
+from verity.registry.ledger import (
+    _PUBLIC_ENCODER,
+    RegistryEntry,
+    _public_view,
+    _utc_now_iso,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS registry_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    certificate_id TEXT PRIMARY KEY,
+    target_system TEXT NOT NULL,
+    target_model TEXT NOT NULL,
+    assessment_date TEXT NOT NULL,
+    asr REAL NOT NULL,
+    total_attacks INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    verification_code TEXT NOT NULL UNIQUE,
+    registry_timestamp TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'active',
+    revocation_reason TEXT,
+    revoked_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_entries_code ON entries(verification_code);
+"""
+
+_ENTRY_FIELDS = (
+    "certificate_id", "target_system", "target_model", "assessment_date",
+    "asr", "total_attacks", "content_hash", "verification_code",
+    "registry_timestamp", "status",
+)
+
+
+class SQLiteSafetyRegistry:
+    """SQLite-backed Safety Registry with the same API as SafetyRegistry.
+
+    Uses WAL journaling with synchronous=NORMAL: registrations append to
+    the write-ahead log instead of rewriting the whole ledger, and
+    readers are never blocked by a writer.
+    """
+
+    def __init__(self, registry_path: str | Path = "registry/VERITY_registry.db"):
+        """Initialize the registry.
+
+        Args:
+            registry_path: Path to the SQLite database file
+        """
+        self.registry_path = Path(registry_path)
+        self.registry_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.registry_path)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.execute(
+            "INSERT OR IGNORE INTO registry_meta (key, value) VALUES (?, ?), (?, ?)",
+            ("version", "1.0.0", "created_at", _utc_now_iso()),
+        )
+        self._conn.commit()
+
+    def register_certificate(
+        self,
+        certificate_id: str,
+        target_system: str,
+        target_model: str,
+        assessment_date: str,
+        asr: float,
+        total_attacks: int,
+        content_hash: str,
+        verification_code: str,
+    ) -> RegistryEntry:
+        """Register a new certificate in the ledger.
+
+        Args: same as SafetyRegistry.register_certificate.
+
+        Returns:
+            RegistryEntry that was added
+
+        Raises:
+            ValueError: If the certificate_id is already registered
+        """
+        entry = RegistryEntry(
+            certificate_id=certificate_id,
+            target_system=target_system,
+            target_model=target_model,
+            assessment_date=assessment_date,
+            asr=asr,
+            total_attacks=total_attacks,
+            content_hash=content_hash,
+            verification_code=verification_code,
+            registry_timestamp=_utc_now_iso(),
+        )
+        try:
+            self._conn.execute(
+                "INSERT INTO entries (certificate_id, target_system, target_model,"
+                " assessment_date, asr, total_attacks, content_hash,"
+                " verification_code, registry_timestamp, status)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                tuple(getattr(entry, f) for f in _ENTRY_FIELDS),
+            )
+            self._conn.commit()
+        except sqlite3.IntegrityError:
+            raise ValueError(f"Certificate {certificate_id} already registered") from None
+        return entry
+
+    def register_many(self, certs: list[dict]) -> list[RegistryEntry]:
+        """Register a batch of certificates in a single transaction.
+
+        Args:
+            certs: Dicts with the register_certificate argument keys
+
+        Returns:
+            List of RegistryEntry objects that were added
+        """
+        now = _utc_now_iso()
+        entries = [RegistryEntry(registry_timestamp=now, **cert) for cert in certs]
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO entries (certificate_id, target_system, target_model,"
+                    " assessment_date, asr, total_attacks, content_hash,"
+                    " verification_code, registry_timestamp, status)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [tuple(getattr(e, f) for f in _ENTRY_FIELDS) for e in entries],
+                )
+        except sqlite3.IntegrityError:
+            raise ValueError("Certificate already registered") from None
+        return entries
+
+    def verify_certificate(self, certificate_id: str) -> dict | None:
+        """Verify if a certificate exists and is active (indexed lookup).
+
+        Args:
+            certificate_id: The certificate UUID to verify
+
+        Returns:
+            Entry dict if found and active, None otherwise
+        """
+        row = self._conn.execute(
+            "SELECT * FROM entries WHERE certificate_id = ? AND status = 'active'",
+            (certificate_id,),
+        ).fetchone()
+        return dict(row) if row else None
+
+    def verify_certificate_obj(self, certificate_id: str) -> RegistryEntry | None:
+        """Like verify_certificate, but returns a RegistryEntry object."""
+        entry_dict = self.verify_certificate(certificate_id)
+        return self._to_entry(entry_dict) if entry_dict else None
+
+    def verify_by_code(self, verification_code: str) -> dict | None:
+        """Verify a certificate by its verification code (indexed lookup).
+
+        Args:
+            verification_code: The VERITY-CERT-XXXX-YYYY code
+
+        Returns:
+            Entry dict if found and active, None otherwise
+        """
+        row = self._conn.execute(
+            "SELECT * FROM entries WHERE verification_code = ? AND status = 'active'",
+            (verification_code,),
+        ).fetchone()
+        return dict(row) if row else None
+
+    def verify_by_code_obj(self, verification_code: str) -> RegistryEntry | None:
+        """Like verify_by_code, but returns a RegistryEntry object."""
+        entry_dict = self.verify_by_code(verification_code)
+        return self._to_entry(entry_dict) if entry_dict else None
+
+    def revoke_certificate(self, certificate_id: str, reason: str = "revoked") -> bool:
+        """Revoke a certificate (single-row update, keeps the audit trail).
+
+        Args:
+            certificate_id: Certificate to revoke
+            reason: Reason for revocation
+
+        Returns:
+            True if revoked, False if not found
+        """
+        cursor = self._conn.execute(
+            "UPDATE entries SET status = 'revoked', revocation_reason = ?,"
+            " revoked_at = ? WHERE certificate_id = ?",
+            (reason, _utc_now_iso(), certificate_id),
+        )
+        self._conn.commit()
+        return cursor.rowcount > 0
+
+    def list_all_certified_systems(
+        self,
+        active_only: bool = True,
+        as_dict: bool = False,
+    ) -> list[RegistryEntry] | list[dict]:
+        """Get a list of all certified systems, newest first.
+
+        Args:
+            active_only: If True, only return active certifications
+            as_dict: If True, return raw row dicts
+
+        Returns:
+            List of RegistryEntry objects (or dicts), newest first
+        """
+        query = "SELECT * FROM entries"
+        if active_only:
+            query += " WHERE status = 'active'"
+        query += " ORDER BY registry_timestamp DESC, rowid DESC"
+
+        rows = self._conn.execute(query).fetchall()
+        if as_dict:
+            return [dict(row) for row in rows]
+        return [self._to_entry(dict(row)) for row in rows]
+
+    def get_statistics(self) -> dict:
+        """Get registry statistics via server-side aggregation.
+
+        Returns:
+            Dictionary with stats
+        """
+        row = self._conn.execute(
+            "SELECT COUNT(*) AS total,"
+            " COALESCE(SUM(status = 'active'), 0) AS active,"
+            " COALESCE(SUM(status = 'revoked'), 0) AS revoked,"
+            " COALESCE(AVG(CASE WHEN status = 'active' THEN asr END), 0.0) AS avg_asr"
+            " FROM entries"
+        ).fetchone()
+        meta = dict(
+            self._conn.execute("SELECT key, value FROM registry_meta").fetchall()
+        )
+        return {
+            "total_certifications": row["total"],
+            "active_certifications": row["active"],
+            "revoked_certifications": row["revoked"],
+            "average_asr": row["avg_asr"],
+            "registry_version": meta["version"],
+            "registry_created": meta["created_at"],
+        }
+
+    def export_public_ledger(self, output_path: str | Path) -> Path:
+        """Export the sanitized public ledger in the JSON ledger format.
+
+        Args:
+            output_path: Where to save the public ledger
+
+        Returns:
+            Path to exported file
+        """
+        output_path = Path(output_path)
+        meta = dict(
+            self._conn.execute("SELECT key, value FROM registry_meta").fetchall()
+        )
+
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write('{\n')
+            f.write(f'  "version": {json.dumps(meta["version"])},\n')
+            f.write(f'  "created_at": {json.dumps(meta["created_at"])},\n')
+            f.write(f'  "last_updated": {json.dumps(_utc_now_iso())},\n')
+            f.write('  "entries": [')
+            separator = '\n    '
+            for row in self._conn.execute("SELECT * FROM entries ORDER BY rowid"):
+                f.write(separator)
+                f.write(_PUBLIC_ENCODER.encode(_public_view(dict(row))))
+                separator = ',\n    '
+            f.write('\n  ]\n}\n')
+
+        return output_path
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def _to_entry(self, row: dict) -> RegistryEntry:
+        """Convert a database row dict to a RegistryEntry."""
+        return RegistryEntry(**{f: row[f] for f in _ENTRY_FIELDS})